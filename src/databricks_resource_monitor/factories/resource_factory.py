@@ -1,24 +1,26 @@
-from typing import List
-from databricks.sdk import WorkspaceClient
+import importlib
+from typing import TYPE_CHECKING, Dict, List, Type, Union
 from ..handlers.base import ResourceHandler
-from ..handlers.model_endpoints import ModelEndpointHandler
-from ..handlers.apps import AppsHandler
 from ..utils.config import ResourceConfig
 
+if TYPE_CHECKING:
+    from databricks.sdk import WorkspaceClient
+
 
 class ResourceHandlerFactory:
     """Factory for creating appropriate resource handlers."""
     
-    _handlers = {
-        'model_endpoints': ModelEndpointHandler,
-        'apps': AppsHandler,
+    # Handlers are registered as 'module:ClassName' and imported on first use
+    _handlers: Dict[str, Union[str, Type[ResourceHandler]]] = {
+        'model_endpoints': 'databricks_resource_monitor.handlers.model_endpoints:ModelEndpointHandler',
+        'apps': 'databricks_resource_monitor.handlers.apps:AppsHandler',
     }
     
     @classmethod
     def create_handler(
         cls, 
         resource_type: str, 
-        workspace_client: WorkspaceClient, 
+        workspace_client: 'WorkspaceClient', 
         resource_config: ResourceConfig
     ) -> ResourceHandler:
         """
@@ -43,6 +45,11 @@ class ResourceHandlerFactory:
             )
         
         handler_class = cls._handlers[resource_type]
+        if isinstance(handler_class, str):
+            module_name, class_name = handler_class.split(':')
+            handler_class = getattr(importlib.import_module(module_name), class_name)
+            cls._handlers[resource_type] = handler_class
+        
         return handler_class(workspace_client, resource_config)
     
     @classmethod
@@ -1,60 +1,57 @@
-from typing import List, Dict, Any
+from typing import Iterator, Dict, Any, Tuple
 from .base import ResourceHandler
 import logging
 
 logger = logging.getLogger(__name__)
 
+_UNKNOWN = 'UNKNOWN'
+
 
 class AppsHandler(ResourceHandler):
     """Handler for Databricks Apps."""
     
-    def list_resources(self) -> List[Dict[str, Any]]:
-        """List all Databricks apps in the workspace."""
+    def _iter_raw_ids_and_objects(self) -> Iterator[Tuple[str, Any]]:
+        """Iterate over (name, app) pairs for all Databricks apps in the workspace."""
         try:
-            apps = list(self.client.apps.list())
-            resources = []
+            count = 0
             
-            for app in apps:
-                resources.append({
-                    'id': app.name,
-                    'name': app.name,
-                    'state': app.status.state if hasattr(app, 'status') and hasattr(app.status, 'state') else 'UNKNOWN',
-                    'creator': app.creator if hasattr(app, 'creator') else 'UNKNOWN',
-                    'creation_time': app.create_time if hasattr(app, 'create_time') else None,
-                    'raw': app
-                })
+            for app in self._iter_listing(self.client.apps.list):
+                count += 1
+                yield app.name, app
             
-            logger.info(f"Found {len(resources)} Databricks apps")
-            return resources
+            logger.info("Found %s Databricks apps", count)
             
         except Exception as e:
-            logger.error(f"Error listing Databricks apps: {str(e)}")
+            logger.error("Error listing Databricks apps: %s", e)
             raise
     
+    def _build_resource_dict(self, app: Any) -> Dict[str, Any]:
+        """Build the resource dictionary for a Databricks app."""
+        return {
+            'id': app.name,
+            'name': app.name,
+            'state': getattr(getattr(app, 'status', None), 'state', _UNKNOWN),
+            'creator': getattr(app, 'creator', _UNKNOWN),
+            'creation_time': getattr(app, 'create_time', None)
+        }
+    
     def delete_resource(self, resource_id: str) -> bool:
         """Delete a Databricks app."""
         try:
             self.client.apps.delete(app_name=resource_id)
-            logger.info(f"Successfully deleted Databricks app: {resource_id}")
+            logger.info("Successfully deleted Databricks app: %s", resource_id)
             return True
             
         except Exception as e:
-            logger.error(f"Failed to delete Databricks app {resource_id}: {str(e)}")
+            logger.error("Failed to delete Databricks app %s: %s", resource_id, e)
             return False
     
-    def get_resource_id(self, resource: Dict[str, Any]) -> str:
-        """Extract the app name as ID."""
-        return resource['id']
-    
     def get_resource_details(self, resource: Dict[str, Any]) -> str:
         """Get human-readable details about the app."""
-        details = [
-            f"Name: {resource['name']}",
-            f"State: {resource['state']}",
-            f"Creator: {resource['creator']}",
-        ]
+        details = f"Name: {resource['name']} | State: {resource['state']} | Creator: {resource['creator']}"
         
-        if resource['creation_time']:
-            details.append(f"Created: {resource['creation_time']}")
+        created = resource['creation_time']
+        if created:
+            details += f" | Created: {created}"
         
-        return " | ".join(details)
\ No newline at end of file
+        return details
\ No newline at end of file
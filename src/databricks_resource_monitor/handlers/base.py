@@ -1,15 +1,36 @@
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any
-from databricks.sdk import WorkspaceClient
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import TYPE_CHECKING, Callable, Iterator, List, Dict, Any, Tuple
+import inspect
 import logging
+from ..utils.env import env_int
+
+if TYPE_CHECKING:
+    from databricks.sdk import WorkspaceClient
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of concurrent delete calls, overridable via DRM_DELETE_CONCURRENCY
+DEFAULT_DELETE_CONCURRENCY = 16
+
+# Requested page size for SDK list calls that support it, overridable via DRM_LIST_PAGE_SIZE.
+# The Apps list API documents page_size only as an upper bound with no stated maximum,
+# so a rejected value falls back to the server default (see _iter_listing).
+DEFAULT_LIST_PAGE_SIZE = 1000
+
+# Name prefix used by resources that Databricks provisions itself
+_DBX_PREFIX = 'databricks-'
+
+
+def _delete_concurrency() -> int:
+    """Resolve the delete worker pool size from the environment."""
+    return env_int('DRM_DELETE_CONCURRENCY', DEFAULT_DELETE_CONCURRENCY)
+
 
 class ResourceHandler(ABC):
     """Abstract base class for handling different Databricks resource types."""
     
-    def __init__(self, workspace_client: WorkspaceClient, resource_config):
+    def __init__(self, workspace_client: 'WorkspaceClient', resource_config):
         """
         Initialize the resource handler.
         
@@ -18,11 +39,43 @@ class ResourceHandler(ABC):
             resource_config: ResourceConfig with whitelist and filtering options
         """
         self.client = workspace_client
-        self.whitelist = set(resource_config.whitelist)
+        self.whitelist = frozenset(resource_config.whitelist)
         self.ignore_databricks_managed = resource_config.ignore_databricks_managed
         self.violations = []
     
     @abstractmethod
+    def _iter_raw_ids_and_objects(self) -> Iterator[Tuple[str, Any]]:
+        """
+        Iterate over the raw SDK objects of this type in the workspace.
+        
+        Yields:
+            Tuples of (resource ID, SDK object)
+        """
+        pass
+    
+    @abstractmethod
+    def _build_resource_dict(self, sdk_object: Any) -> Dict[str, Any]:
+        """
+        Build a resource dictionary from a raw SDK object.
+        
+        Args:
+            sdk_object: Object yielded by _iter_raw_ids_and_objects
+            
+        Returns:
+            Resource dictionary with at least 'id' and 'name' fields
+        """
+        pass
+    
+    def iter_resources(self) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over all resources of this type in the workspace.
+        
+        Yields:
+            Resource dictionaries with at least 'id' and 'name' fields
+        """
+        for _, sdk_object in self._iter_raw_ids_and_objects():
+            yield self._build_resource_dict(sdk_object)
+    
     def list_resources(self) -> List[Dict[str, Any]]:
         """
         List all resources of this type in the workspace.
@@ -30,7 +83,7 @@ class ResourceHandler(ABC):
         Returns:
             List of resource dictionaries with at least 'id' and 'name' fields
         """
-        pass
+        return list(self.iter_resources())
     
     @abstractmethod
     def delete_resource(self, resource_id: str) -> bool:
@@ -46,30 +99,79 @@ class ResourceHandler(ABC):
         pass
     
     @abstractmethod
-    def get_resource_id(self, resource: Dict[str, Any]) -> str:
+    def get_resource_details(self, resource: Dict[str, Any]) -> str:
         """
-        Extract the resource ID from a resource object.
+        Get human-readable details about a resource for logging/alerting.
         
         Args:
             resource: Resource dictionary
             
         Returns:
-            Resource ID as string
+            Formatted string with resource details
         """
         pass
     
-    @abstractmethod
-    def get_resource_details(self, resource: Dict[str, Any]) -> str:
+    @staticmethod
+    def _list_kwargs(list_method: Callable) -> Dict[str, Any]:
         """
-        Get human-readable details about a resource for logging/alerting.
+        Build keyword arguments for an SDK list call.
+        
+        Requests a larger page size when the SDK method accepts one, so fewer
+        HTTP round-trips are needed to walk the full listing. Older SDK versions
+        without a page_size parameter are called with no arguments.
         
         Args:
-            resource: Resource dictionary
-            
+            list_method: SDK list method, e.g. client.apps.list
+        
         Returns:
-            Formatted string with resource details
+            Keyword arguments to pass to list_method
         """
-        pass
+        try:
+            parameters = inspect.signature(list_method).parameters
+        except (TypeError, ValueError):
+            return {}
+        
+        if 'page_size' not in parameters:
+            return {}
+        
+        return {'page_size': env_int('DRM_LIST_PAGE_SIZE', DEFAULT_LIST_PAGE_SIZE)}
+    
+    def _iter_listing(self, list_method: Callable) -> Iterator[Any]:
+        """
+        Iterate over an SDK listing, requesting larger pages where supported.
+        
+        If the server rejects the requested page_size when fetching the first
+        page, the listing is restarted without it.
+        
+        Args:
+            list_method: SDK list method, e.g. client.apps.list
+            
+        Yields:
+            SDK objects returned by the listing
+        """
+        kwargs = self._list_kwargs(list_method)
+        if not kwargs:
+            yield from list_method()
+            return
+        
+        # Imported lazily like the rest of the SDK; a client exists by the time we list
+        from databricks.sdk.errors import BadRequest
+        
+        iterator = iter(list_method(**kwargs))
+        try:
+            first = next(iterator)
+        except StopIteration:
+            return
+        except BadRequest as e:
+            logger.warning(
+                "List call rejected page_size=%s, retrying with the default page size: %s",
+                kwargs['page_size'], e
+            )
+            yield from list_method()
+            return
+        
+        yield first
+        yield from iterator
     
     def is_databricks_managed(self, resource: Dict[str, Any]) -> bool:
         """
@@ -85,7 +187,7 @@ class ResourceHandler(ABC):
         creator = resource.get('creator')
         name = resource.get('name', '')
         
-        return creator is None and name.startswith('databricks-')
+        return creator is None and name.startswith(_DBX_PREFIX)
     
     def check_resources(self, dry_run: bool = False) -> List[Dict[str, Any]]:
         """
@@ -98,37 +200,46 @@ class ResourceHandler(ABC):
             List of violation dictionaries
         """
         self.violations = []
-        resources = self.list_resources()
+        checked = 0
         
-        logger.info(f"Found {len(resources)} resources to check")
+        # Bind loop invariants to locals to avoid attribute lookups per resource
+        whitelist = self.whitelist
+        ignore_dbx = self.ignore_databricks_managed
+        is_dbx = self.is_databricks_managed
+        build_resource = self._build_resource_dict
+        get_details = self.get_resource_details
+        violations_append = self.violations.append
         
-        for resource in resources:
-            resource_id = self.get_resource_id(resource)
+        for resource_id, sdk_object in self._iter_raw_ids_and_objects():
+            checked += 1
             
-            # Skip if resource is in whitelist
-            if resource_id in self.whitelist:
+            # Skip if resource is in whitelist, before paying for the full resource dict
+            if resource_id in whitelist:
                 continue
             
+            resource = build_resource(sdk_object)
+            
             # Skip if Databricks-managed and configured to ignore them
-            if self.ignore_databricks_managed and self.is_databricks_managed(resource):
-                logger.debug(f"Ignoring Databricks-managed resource: {resource_id}")
+            if ignore_dbx and is_dbx(resource):
+                logger.debug("Ignoring Databricks-managed resource: %s", resource_id)
                 continue
             
             # Resource is a violation
             violation = {
                 'id': resource_id,
-                'details': self.get_resource_details(resource),
+                'details': get_details(resource),
                 'action_taken': None
             }
             
             if not dry_run:
-                logger.warning(f"Resource {resource_id} not in whitelist - marking for action")
+                logger.warning("Resource %s not in whitelist - marking for action", resource_id)
             else:
-                logger.info(f"[DRY RUN] Resource {resource_id} not in whitelist")
+                logger.info("[DRY RUN] Resource %s not in whitelist", resource_id)
             
-            self.violations.append(violation)
+            violations_append(violation)
         
-        logger.info(f"Found {len(self.violations)} violations")
+        logger.info("Checked %s resources", checked)
+        logger.info("Found %s violations", len(self.violations))
         return self.violations
     
     def handle_violations(self, action_mode: str) -> Dict[str, Any]:
@@ -152,26 +263,35 @@ class ResourceHandler(ABC):
         }
         
         if action_mode == 'delete':
-            for violation in self.violations:
-                try:
-                    success = self.delete_resource(violation['id'])
-                    if success:
-                        action = f"Deleted resource {violation['id']}"
-                        violation['action_taken'] = 'deleted'
-                    else:
-                        action = f"Failed to delete resource {violation['id']}"
-                        violation['action_taken'] = 'delete_failed'
+            # Deletes are independent, network-bound API calls, so issue them concurrently
+            max_workers = min(_delete_concurrency(), len(self.violations))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = {
+                    executor.submit(self.delete_resource, violation['id']): violation
+                    for violation in self.violations
+                }
+                
+                for future in as_completed(futures):
+                    violation = futures[future]
+                    try:
+                        success = future.result()
+                        if success:
+                            action = f"Deleted resource {violation['id']}"
+                            violation['action_taken'] = 'deleted'
+                        else:
+                            action = f"Failed to delete resource {violation['id']}"
+                            violation['action_taken'] = 'delete_failed'
+                            results['status'] = 'partial_failure'
+                        
+                        results['actions'].append(action)
+                        logger.info(action)
+                        
+                    except Exception as e:
+                        action = f"Error deleting resource {violation['id']}: {str(e)}"
+                        violation['action_taken'] = 'error'
                         results['status'] = 'partial_failure'
-                    
-                    results['actions'].append(action)
-                    logger.info(action)
-                    
-                except Exception as e:
-                    action = f"Error deleting resource {violation['id']}: {str(e)}"
-                    violation['action_taken'] = 'error'
-                    results['status'] = 'partial_failure'
-                    results['actions'].append(action)
-                    logger.error(action)
+                        results['actions'].append(action)
+                        logger.error(action)
         
         elif action_mode == 'alert':
             # Generate alert by raising an exception that will trigger job failure
@@ -1,60 +1,57 @@
-from typing import List, Dict, Any
+from typing import Iterator, Dict, Any, Tuple
 from .base import ResourceHandler
 import logging
 
 logger = logging.getLogger(__name__)
 
+_UNKNOWN = 'UNKNOWN'
+
 
 class ModelEndpointHandler(ResourceHandler):
     """Handler for Databricks Model Serving Endpoints."""
     
-    def list_resources(self) -> List[Dict[str, Any]]:
-        """List all model serving endpoints in the workspace."""
+    def _iter_raw_ids_and_objects(self) -> Iterator[Tuple[str, Any]]:
+        """Iterate over (name, endpoint) pairs for all model serving endpoints in the workspace."""
         try:
-            endpoints = list(self.client.serving_endpoints.list())
-            resources = []
+            count = 0
             
-            for endpoint in endpoints:
-                resources.append({
-                    'id': endpoint.name,  # Using name as ID for endpoints
-                    'name': endpoint.name,
-                    'state': endpoint.state.config_update if hasattr(endpoint.state, 'config_update') else 'UNKNOWN',
-                    'creator': endpoint.creator if hasattr(endpoint, 'creator') else 'UNKNOWN',
-                    'creation_timestamp': endpoint.creation_timestamp if hasattr(endpoint, 'creation_timestamp') else None,
-                    'raw': endpoint
-                })
+            for endpoint in self._iter_listing(self.client.serving_endpoints.list):
+                count += 1
+                yield endpoint.name, endpoint
             
-            logger.info(f"Found {len(resources)} model serving endpoints")
-            return resources
+            logger.info("Found %s model serving endpoints", count)
             
         except Exception as e:
-            logger.error(f"Error listing model serving endpoints: {str(e)}")
+            logger.error("Error listing model serving endpoints: %s", e)
             raise
     
+    def _build_resource_dict(self, endpoint: Any) -> Dict[str, Any]:
+        """Build the resource dictionary for a model serving endpoint."""
+        return {
+            'id': endpoint.name,  # Using name as ID for endpoints
+            'name': endpoint.name,
+            'state': getattr(getattr(endpoint, 'state', None), 'config_update', _UNKNOWN),
+            'creator': getattr(endpoint, 'creator', _UNKNOWN),
+            'creation_timestamp': getattr(endpoint, 'creation_timestamp', None)
+        }
+    
     def delete_resource(self, resource_id: str) -> bool:
         """Delete a model serving endpoint."""
         try:
             self.client.serving_endpoints.delete(name=resource_id)
-            logger.info(f"Successfully deleted model serving endpoint: {resource_id}")
+            logger.info("Successfully deleted model serving endpoint: %s", resource_id)
             return True
             
         except Exception as e:
-            logger.error(f"Failed to delete model serving endpoint {resource_id}: {str(e)}")
+            logger.error("Failed to delete model serving endpoint %s: %s", resource_id, e)
             return False
     
-    def get_resource_id(self, resource: Dict[str, Any]) -> str:
-        """Extract the endpoint name as ID."""
-        return resource['id']
-    
     def get_resource_details(self, resource: Dict[str, Any]) -> str:
         """Get human-readable details about the endpoint."""
-        details = [
-            f"Name: {resource['name']}",
-            f"State: {resource['state']}",
-            f"Creator: {resource['creator']}",
-        ]
+        details = f"Name: {resource['name']} | State: {resource['state']} | Creator: {resource['creator']}"
         
-        if resource['creation_timestamp']:
-            details.append(f"Created: {resource['creation_timestamp']}")
+        created = resource['creation_timestamp']
+        if created:
+            details += f" | Created: {created}"
         
-        return " | ".join(details)
\ No newline at end of file
+        return details
\ No newline at end of file
@@ -1,10 +1,13 @@
 import argparse
 import logging
 import sys
-from databricks.sdk import WorkspaceClient
+from typing import TYPE_CHECKING, List, Optional
 from .factories.resource_factory import ResourceHandlerFactory
 from .utils.config import ConfigLoader
 
+if TYPE_CHECKING:
+    from databricks.sdk import WorkspaceClient
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -23,8 +26,10 @@ def parse_arguments():
         '--resource-type',
         type=str,
         required=True,
+        nargs='+',
+        action='extend',
         choices=ResourceHandlerFactory.get_supported_types(),
-        help='Type of resource to monitor'
+        help='Type(s) of resource to monitor; may be given multiple values or repeated'
     )
     
     parser.add_argument(
@@ -55,7 +60,138 @@ def parse_arguments():
         help='Databricks CLI profile to use for authentication (for local development)'
     )
     
-    return parser.parse_args()
+    args = parser.parse_args()
+    
+    # Drop duplicates while keeping the order given on the command line
+    args.resource_type = list(dict.fromkeys(args.resource_type))
+    
+    if args.whitelist_path and len(args.resource_type) > 1:
+        parser.error('--whitelist-path can only be used with a single --resource-type')
+    
+    return args
+
+
+def monitor_resource_type(
+    resource_type: str,
+    client: 'WorkspaceClient',
+    action_mode: str,
+    dry_run: bool = False,
+    whitelist_path: Optional[str] = None
+) -> bool:
+    """
+    Check a single resource type against its whitelist and act on violations.
+    
+    Args:
+        resource_type: Type of resource to monitor
+        client: Databricks workspace client
+        action_mode: Either 'delete' or 'alert'
+        dry_run: If True, only report violations without taking action
+        whitelist_path: Optional custom path to the whitelist JSON file
+        
+    Returns:
+        False if the config was missing or some delete actions failed, True otherwise
+        
+    Raises:
+        Exception: In alert mode, when violations are found
+    """
+    logger.info("Starting resource monitor for %s", resource_type)
+    
+    # Load resource configuration
+    try:
+        resource_config = ConfigLoader.load_resource_config(resource_type, whitelist_path)
+    except FileNotFoundError:
+        logger.error(
+            "Config file not found for resource type: %s. "
+            "Please create a config file or specify --whitelist-path",
+            resource_type
+        )
+        return False
+    
+    # Create handler
+    handler = ResourceHandlerFactory.create_handler(
+        resource_type,
+        client,
+        resource_config
+    )
+    
+    # Check resources
+    violations = handler.check_resources(dry_run=dry_run)
+    
+    if not violations:
+        logger.info("No violations found. All resources are whitelisted.")
+        return True
+    
+    # Handle violations if not in dry-run mode
+    if not dry_run:
+        logger.info("Handling %s violations with action: %s", len(violations), action_mode)
+        results = handler.handle_violations(action_mode)
+        
+        if action_mode == 'delete':
+            logger.info("Action summary: %s", results)
+            
+            if results['status'] == 'partial_failure':
+                logger.error("Some actions failed. Check logs for details.")
+                return False
+    else:
+        # In dry-run mode, just report what would happen
+        logger.info("[DRY RUN] Would handle %s violations:", len(violations))
+        for violation in violations:
+            logger.info("[DRY RUN] - %s: %s", violation['id'], violation['details'])
+        
+        if action_mode == 'alert':
+            logger.info("[DRY RUN] Would raise exception to trigger email alerts")
+        else:
+            logger.info("[DRY RUN] Would delete %s resources", len(violations))
+    
+    logger.info("Resource monitoring completed successfully")
+    return True
+
+
+def run_monitor(
+    resource_types: List[str],
+    client: 'WorkspaceClient',
+    action_mode: str,
+    dry_run: bool = False,
+    whitelist_path: Optional[str] = None
+) -> bool:
+    """
+    Monitor several resource types with a shared workspace client.
+    
+    Every resource type is checked even if an earlier one fails, so a single
+    alert does not hide violations in the others.
+    
+    Args:
+        resource_types: Types of resource to monitor
+        client: Databricks workspace client shared by all handlers
+        action_mode: Either 'delete' or 'alert'
+        dry_run: If True, only report violations without taking action
+        whitelist_path: Optional custom whitelist path (single resource type only)
+        
+    Returns:
+        False if any resource type reported a failure, True otherwise
+        
+    Raises:
+        Exception: If any resource type raised, e.g. an alert in alert mode
+    """
+    succeeded = True
+    errors = []
+    
+    for resource_type in resource_types:
+        try:
+            if not monitor_resource_type(resource_type, client, action_mode, dry_run, whitelist_path):
+                succeeded = False
+        except Exception as e:
+            errors.append((resource_type, e))
+    
+    if len(errors) == 1:
+        raise errors[0][1]
+    if errors:
+        # The first error becomes the cause of the combined one; log the rest with tracebacks
+        for resource_type, e in errors[1:]:
+            logger.exception("Monitoring %s failed", resource_type, exc_info=e)
+        raise Exception("\n\n".join(str(e) for _, e in errors)) from errors[0][1]
+    
+    return succeeded
 
 
 def main():
@@ -64,9 +200,12 @@ def main():
         # Parse arguments
         args = parse_arguments()
         
-        logger.info(f"Starting resource monitor for {args.resource_type}")
-        logger.info(f"Action mode: {args.action_mode}")
-        logger.info(f"Dry run: {args.dry_run}")
+        # Imported here so --help and argument errors don't pay for the SDK import
+        from databricks.sdk import WorkspaceClient
+        
+        logger.info("Resource types: %s", ", ".join(args.resource_type))
+        logger.info("Action mode: %s", args.action_mode)
+        logger.info("Dry run: %s", args.dry_run)
         
         # Initialize Databricks client
         # The SDK automatically uses the environment's authentication
@@ -76,59 +215,19 @@ def main():
         else:
             client = WorkspaceClient()
         
-        # Load resource configuration
-        try:
-            resource_config = ConfigLoader.load_resource_config(
-                args.resource_type, 
-                args.whitelist_path
-            )
-        except FileNotFoundError:
-            logger.error(
-                f"Config file not found for resource type: {args.resource_type}. "
-                f"Please create a config file or specify --whitelist-path"
-            )
-            sys.exit(1)
-        
-        # Create handler
-        handler = ResourceHandlerFactory.create_handler(
+        succeeded = run_monitor(
             args.resource_type,
             client,
-            resource_config
+            args.action_mode,
+            dry_run=args.dry_run,
+            whitelist_path=args.whitelist_path
         )
         
-        # Check resources
-        violations = handler.check_resources(dry_run=args.dry_run)
-        
-        if not violations:
-            logger.info("No violations found. All resources are whitelisted.")
-            return
-        
-        # Handle violations if not in dry-run mode
-        if not args.dry_run:
-            logger.info(f"Handling {len(violations)} violations with action: {args.action_mode}")
-            results = handler.handle_violations(args.action_mode)
-            
-            if args.action_mode == 'delete':
-                logger.info(f"Action summary: {results}")
-                
-                if results['status'] == 'partial_failure':
-                    logger.error("Some actions failed. Check logs for details.")
-                    sys.exit(1)
-        else:
-            # In dry-run mode, just report what would happen
-            logger.info(f"[DRY RUN] Would handle {len(violations)} violations:")
-            for violation in violations:
-                logger.info(f"[DRY RUN] - {violation['id']}: {violation['details']}")
-            
-            if args.action_mode == 'alert':
-                logger.info("[DRY RUN] Would raise exception to trigger email alerts")
-            else:
-                logger.info(f"[DRY RUN] Would delete {len(violations)} resources")
-        
-        logger.info("Resource monitoring completed successfully")
+        if not succeeded:
+            sys.exit(1)
         
     except Exception as e:
-        logger.error(f"Job failed with error: {str(e)}")
+        logger.error("Job failed with error: %s", e)
         # Re-raise to ensure job failure is properly reported
         raise
 
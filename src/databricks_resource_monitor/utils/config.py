@@ -1,18 +1,227 @@
+import atexit
+import contextlib
+import functools
 import json
 import os
-from typing import List, Optional
+import pathlib
+import tempfile
+import threading
+import time
+from typing import Any, Iterable, List, Optional, Tuple
 import logging
-import importlib.resources as pkg_resources
+import importlib.resources
 from databricks_resource_monitor.config import whitelists
+from databricks_resource_monitor.utils.env import env_int
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
+# Traversable for the embedded whitelists package, resolved once at import
+_WHITELIST_DIR = importlib.resources.files(whitelists)
+
+# Local development fallback: <project_root>/config/whitelists
+_PROJECT_ROOT = pathlib.Path(__file__).resolve().parents[3]
+_DEFAULT_WHITELIST_DIR = _PROJECT_ROOT / "config" / "whitelists"
+
+# Databricks workspace whitelists and their optional local mirror
+_WORKSPACE_WHITELIST_DIR = pathlib.Path("/Workspace/config/whitelists")
+
+# Mirrors older than this many TTLs are never served, bounding how long an edit can be missed
+_WHITELIST_MAX_STALE_FACTOR = 4
+
+# How long interpreter exit waits for background mirror refreshes to finish
+_REFRESH_JOIN_TIMEOUT_SEC = 5.0
+
+# Leftover mirror temp files older than this are assumed abandoned and removed
+_STALE_TMP_AGE_SEC = 600
+
+# Background mirror refreshes started by this process, joined at exit
+_refresh_threads: List[threading.Thread] = []
+
+
+def _json_loads(raw: bytes):
+    """Parse JSON from raw bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _json_dumps(data) -> bytes:
+    """Serialize data to indented JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode('utf-8')
+
+
+def _whitelist_cache_dir() -> pathlib.Path:
+    """
+    Resolve the local whitelist mirror directory.
+    
+    Resolved on demand rather than at import, since Path.home() raises
+    RuntimeError when HOME is unset and the UID has no passwd entry.
+    """
+    return pathlib.Path.home() / ".cache" / "drm" / "whitelists"
+
+
+def _sweep_stale_mirror_tmp_files(mirror: pathlib.Path) -> None:
+    """Remove temp files left behind by mirror writes that never finished."""
+    cutoff = time.time() - _STALE_TMP_AGE_SEC
+    for tmp_path in mirror.parent.glob(f".{mirror.name}.*.tmp"):
+        with contextlib.suppress(OSError):
+            if tmp_path.stat().st_mtime < cutoff:
+                tmp_path.unlink()
+
+
+def _write_whitelist_mirror(mirror: pathlib.Path, raw: bytes) -> None:
+    """Atomically write raw whitelist bytes to the local mirror."""
+    tmp_name = None
+    try:
+        mirror.parent.mkdir(parents=True, exist_ok=True)
+        _sweep_stale_mirror_tmp_files(mirror)
+        # A unique temp file per writer, so concurrent refreshes never share one
+        with tempfile.NamedTemporaryFile(
+            dir=mirror.parent, prefix=f".{mirror.name}.", suffix='.tmp', delete=False
+        ) as tmp:
+            tmp_name = tmp.name
+            tmp.write(raw)
+        os.replace(tmp_name, mirror)
+    except OSError as e:
+        logger.warning("Failed to update whitelist mirror %s: %s", mirror, e)
+        if tmp_name:
+            with contextlib.suppress(OSError):
+                os.unlink(tmp_name)
+
+
+def _refresh_whitelist_mirror(source: pathlib.Path, mirror: pathlib.Path) -> None:
+    """Re-fetch a workspace whitelist into the mirror, keeping the stale copy on transient failure."""
+    try:
+        raw = source.read_bytes()
+    except FileNotFoundError:
+        # The whitelist was removed from the workspace; stop serving the mirror
+        logger.warning("Whitelist %s no longer exists, removing mirror %s", source, mirror)
+        with contextlib.suppress(OSError):
+            mirror.unlink()
+        return
+    except OSError as e:
+        logger.warning("Failed to refresh whitelist from %s, keeping cached copy: %s", source, e)
+        return
+    
+    try:
+        _json_loads(raw)
+    except ValueError as e:
+        logger.warning("Whitelist %s is not valid JSON, keeping cached copy: %s", source, e)
+        return
+    
+    _write_whitelist_mirror(mirror, raw)
+
+
+@atexit.register
+def _join_refresh_threads() -> None:
+    """Give background mirror refreshes a bounded chance to finish before exit."""
+    deadline = time.monotonic() + _REFRESH_JOIN_TIMEOUT_SEC
+    for thread in _refresh_threads:
+        thread.join(max(0.0, deadline - time.monotonic()))
+        if thread.is_alive():
+            logger.warning("Whitelist mirror refresh did not finish before exit")
+
+
+def _read_whitelist_mirror(source: pathlib.Path, mirror: pathlib.Path, ttl: int) -> Optional[Any]:
+    """
+    Parse the local mirror of a workspace whitelist if it is still usable.
+    
+    A mirror older than the TTL is served while a background thread refreshes
+    it. One older than _WHITELIST_MAX_STALE_FACTOR times the TTL, or one that
+    fails to parse, is ignored so the caller reads the source instead.
+    
+    Args:
+        source: Path of the whitelist in the workspace filesystem
+        mirror: Path of the local mirror
+        ttl: Mirror TTL in seconds
+        
+    Returns:
+        Parsed whitelist data, or None if the mirror should not be used
+    """
+    try:
+        age = time.time() - mirror.stat().st_mtime
+        raw = mirror.read_bytes()
+    except OSError:
+        return None
+    
+    if age >= ttl * _WHITELIST_MAX_STALE_FACTOR:
+        logger.info("Whitelist mirror %s is %ds old, past the staleness limit; reading source", mirror, age)
+        return None
+    
+    try:
+        data = _json_loads(raw)
+    except ValueError as e:
+        logger.warning("Ignoring invalid whitelist mirror %s: %s", mirror, e)
+        return None
+    
+    logger.info("Loading resource config from mirror: %s", mirror)
+    if age >= ttl:
+        logger.info("Whitelist mirror is %ds old, refreshing in background", age)
+        thread = threading.Thread(
+            target=_refresh_whitelist_mirror,
+            args=(source, mirror),
+            daemon=True
+        )
+        thread.start()
+        _refresh_threads.append(thread)
+    
+    return data
+
+
+def _read_workspace_whitelist(source: pathlib.Path) -> Optional[Any]:
+    """
+    Read and parse a workspace whitelist, serving it from the local mirror when enabled.
+    
+    With DRM_WHITELIST_TTL_SEC set, a valid mirrored copy is returned without
+    touching the workspace filesystem and refreshed in the background once it
+    is older than the TTL (stale-while-revalidate).
+    
+    Args:
+        source: Path of the whitelist in the workspace filesystem
+        
+    Returns:
+        Parsed whitelist data, or None if neither a usable mirror nor the source exists
+    """
+    # Mirroring stays disabled (0) unless configured, since serving a stale
+    # whitelist in delete mode could remove a newly whitelisted resource
+    ttl = env_int('DRM_WHITELIST_TTL_SEC', 0, minimum=0)
+    
+    if ttl:
+        try:
+            mirror = _whitelist_cache_dir() / source.name
+        except RuntimeError as e:
+            logger.warning("Whitelist mirror unavailable, reading %s directly: %s", source, e)
+            ttl = 0
+    
+    if ttl:
+        data = _read_whitelist_mirror(source, mirror, ttl)
+        if data is not None:
+            return data
+    
+    if not source.exists():
+        return None
+    
+    logger.info("Loading resource config from: %s", source)
+    raw = source.read_bytes()
+    data = _json_loads(raw)
+    if ttl:
+        _write_whitelist_mirror(mirror, raw)
+    return data
+
 
 class ResourceConfig:
     """Configuration for a resource type including whitelist and filtering options."""
     
-    def __init__(self, whitelist: List[str], ignore_databricks_managed: bool = False):
-        self.whitelist = whitelist
+    def __init__(self, whitelist: Iterable[str], ignore_databricks_managed: bool = False):
+        # Stored as a tuple since loaded configs are cached and shared between callers
+        self.whitelist: Tuple[str, ...] = tuple(whitelist)
         self.ignore_databricks_managed = ignore_databricks_managed
 
 
@@ -24,6 +233,9 @@ class ConfigLoader:
         """
         Load configuration for a specific resource type.
         
+        Results are cached per (resource_type, custom_path) for the lifetime of
+        the process; use ConfigLoader.clear_cache() to force a reload.
+        
         Args:
             resource_type: Type of resource (e.g., 'model_endpoints', 'apps')
             custom_path: Optional custom path to config file
@@ -35,65 +247,84 @@ class ConfigLoader:
             FileNotFoundError: If config file doesn't exist
             json.JSONDecodeError: If config file is invalid JSON
         """
+        return _load_resource_config_cached(resource_type, custom_path)
+    
+    @staticmethod
+    def clear_cache() -> None:
+        """Discard all cached resource configs so the next load re-reads them."""
+        _load_resource_config_cached.cache_clear()
+    
+    @staticmethod
+    def _read_resource_config(resource_type: str, custom_path: Optional[str] = None) -> ResourceConfig:
+        """Read and parse the config file for a resource type (uncached)."""
         if custom_path:
             config_path = custom_path
-            logger.info(f"Loading resource config from custom path: {config_path}")
-            with open(config_path, 'r') as f:
-                data = json.load(f)
+            logger.info("Loading resource config from custom path: %s", config_path)
+            with open(config_path, 'rb') as f:
+                data = _json_loads(f.read())
         else:
             # First, try to load from package resources
             try:
-                logger.info(f"Loading resource config from package for: {resource_type}")
-                config_file = f"{resource_type}.json"
-                config_data = pkg_resources.read_text(whitelists, config_file)
-                data = json.loads(config_data)
-                logger.info(f"Successfully loaded config from package")
-            except (FileNotFoundError, ModuleNotFoundError) as e:
-                logger.info(f"Package resource not found, trying workspace path")
+                logger.info("Loading resource config from package for: %s", resource_type)
+                config_data = (_WHITELIST_DIR / f"{resource_type}.json").read_bytes()
+                data = _json_loads(config_data)
+                logger.info("Successfully loaded config from package")
+            except FileNotFoundError:
+                logger.info("Package resource not found, trying workspace path")
                 # Fallback to Databricks workspace path
-                config_path = f"/Workspace/config/whitelists/{resource_type}.json"
+                data = _read_workspace_whitelist(_WORKSPACE_WHITELIST_DIR / f"{resource_type}.json")
                 
                 # For local development, use relative path
-                if not os.path.exists(config_path):
-                    project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
-                    config_path = os.path.join(project_root, "config", "whitelists", f"{resource_type}.json")
-                
-                logger.info(f"Loading resource config from: {config_path}")
-                with open(config_path, 'r') as f:
-                    data = json.load(f)
+                if data is None:
+                    config_path = str(_DEFAULT_WHITELIST_DIR / f"{resource_type}.json")
+                    logger.info("Loading resource config from: %s", config_path)
+                    with open(config_path, 'rb') as f:
+                        data = _json_loads(f.read())
         
         try:
-            # Support both array format and object with 'whitelist' key
-            if isinstance(data, list):
-                whitelist = data
-                ignore_databricks_managed = False
-            elif isinstance(data, dict):
-                if 'whitelist' in data:
-                    whitelist = data['whitelist']
-                else:
-                    raise ValueError("Object format must contain 'whitelist' key")
-                
-                # Load filtering options
-                ignore_databricks_managed = data.get('ignore_databricks_managed', False)
-            else:
-                raise ValueError("Invalid config format. Expected array or object with 'whitelist' key")
+            config = ConfigLoader._coerce(data)
             
-            logger.info(f"Loaded {len(whitelist)} whitelisted IDs for {resource_type}")
-            if ignore_databricks_managed:
-                logger.info(f"Configured to ignore Databricks-managed {resource_type}")
+            logger.info("Loaded %s whitelisted IDs for %s", len(config.whitelist), resource_type)
+            if config.ignore_databricks_managed:
+                logger.info("Configured to ignore Databricks-managed %s", resource_type)
             
-            return ResourceConfig(whitelist, ignore_databricks_managed)
+            return config
             
-        except FileNotFoundError:
-            logger.error(f"Config file not found: {config_path}")
-            raise
-        except json.JSONDecodeError as e:
-            logger.error(f"Invalid JSON in config file: {e}")
-            raise
         except Exception as e:
-            logger.error(f"Error loading config: {e}")
+            logger.error("Error loading config: %s", e)
             raise
     
+    @staticmethod
+    def _coerce(data) -> ResourceConfig:
+        """
+        Normalize parsed config data into a ResourceConfig.
+        
+        The object form ({"whitelist": [...], ...}) is canonical. The bare array
+        form is still accepted but deprecated.
+        
+        Args:
+            data: Parsed JSON config data
+            
+        Returns:
+            ResourceConfig with whitelist and filtering options
+            
+        Raises:
+            ValueError: If data is not in a supported format
+        """
+        if isinstance(data, dict):
+            if 'whitelist' not in data:
+                raise ValueError("Object format must contain 'whitelist' key")
+            return ResourceConfig(data['whitelist'], data.get('ignore_databricks_managed', False))
+        
+        if isinstance(data, list):
+            logger.warning(
+                "Array-format whitelist configs are deprecated; "
+                "use an object with a 'whitelist' key instead"
+            )
+            return ResourceConfig(data)
+        
+        raise ValueError("Invalid config format. Expected array or object with 'whitelist' key")
+    
     @staticmethod
     def load_whitelist(resource_type: str, custom_path: Optional[str] = None) -> List[str]:
         """
@@ -107,7 +338,7 @@ class ConfigLoader:
             List of whitelisted resource IDs
         """
         config = ConfigLoader.load_resource_config(resource_type, custom_path)
-        return config.whitelist
+        return list(config.whitelist)
     
     @staticmethod
     def create_default_whitelist(resource_type: str, resource_ids: List[str]) -> str:
@@ -121,19 +352,24 @@ class ConfigLoader:
         Returns:
             Path to created whitelist file
         """
-        project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
-        whitelist_dir = os.path.join(project_root, "config", "whitelists")
-        os.makedirs(whitelist_dir, exist_ok=True)
+        os.makedirs(_DEFAULT_WHITELIST_DIR, exist_ok=True)
         
-        whitelist_path = os.path.join(whitelist_dir, f"{resource_type}.json")
+        whitelist_path = str(_DEFAULT_WHITELIST_DIR / f"{resource_type}.json")
         
         whitelist_data = {
             "description": f"Whitelist for {resource_type}",
             "whitelist": resource_ids
         }
         
-        with open(whitelist_path, 'w') as f:
-            json.dump(whitelist_data, f, indent=2)
+        with open(whitelist_path, 'wb') as f:
+            f.write(_json_dumps(whitelist_data))
         
-        logger.info(f"Created default whitelist at: {whitelist_path}")
-        return whitelist_path
\ No newline at end of file
+        ConfigLoader.clear_cache()
+        logger.info("Created default whitelist at: %s", whitelist_path)
+        return whitelist_path
+
+
+@functools.lru_cache(maxsize=None)
+def _load_resource_config_cached(resource_type: str, custom_path: Optional[str]) -> ResourceConfig:
+    """Memoized loader backing ConfigLoader.load_resource_config."""
+    return ConfigLoader._read_resource_config(resource_type, custom_path)
@@ -0,0 +1,27 @@
+import logging
+import os
+
+logger = logging.getLogger(__name__)
+
+
+def env_int(name: str, default: int, minimum: int = 1) -> int:
+    """
+    Read an integer setting from the environment.
+    
+    Args:
+        name: Environment variable name
+        default: Value to use when the variable is unset or not an integer
+        minimum: Lower bound applied to configured values
+        
+    Returns:
+        The configured value clamped to minimum, or default
+    """
+    value = os.environ.get(name)
+    if not value:
+        return default
+    
+    try:
+        return max(minimum, int(value))
+    except ValueError:
+        logger.warning("Invalid %s value '%s', using default of %s", name, value, default)
+        return default